@@ -21,4 +21,8 @@ def run():
     argparser.add_argument('module', metavar='module', type=str, help='the module name of the domain', default=None)
 
     args = argparser.parse_args()
-    print(''.join(py2puml(args.path, args.module)))
+
+    # writes the diagram parts as they are generated, without concatenating them into a whole copy of the diagram
+    for puml_part in py2puml(args.path, args.module):
+        print(puml_part, end='')
+    print()
@@ -5,6 +5,7 @@ from py2puml.domain.umlitem import UmlItem
 
 @dataclass
 class UmlAttribute:
+    __slots__ = ('name', 'type', 'static')
     name: str
     type: str
     static: bool
@@ -5,9 +5,11 @@ from py2puml.domain.umlitem import UmlItem
 
 @dataclass
 class Member:
+    __slots__ = ('name', 'value')
     name: str
     value: str
 
 @dataclass
 class UmlEnum(UmlItem):
+    __slots__ = ('members',)
     members: List[Member]
@@ -2,5 +2,6 @@ from dataclasses import dataclass
 
 @dataclass
 class UmlItem:
+    __slots__ = ('name', 'fqn')
     name: str
     fqn: str
\ No newline at end of file
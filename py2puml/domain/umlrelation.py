@@ -8,6 +8,7 @@ class RelType(Enum):
 
 @dataclass
 class UmlRelation:
+    __slots__ = ('source_fqn', 'target_fqn', 'type')
     source_fqn: str
     target_fqn: str
     type: RelType
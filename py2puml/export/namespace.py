@@ -1,4 +1,5 @@
-from typing import Iterable, List, Tuple
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from py2puml.domain.package import Package
 from py2puml.domain.umlitem import UmlItem
@@ -6,28 +7,23 @@ from py2puml.domain.umlitem import UmlItem
 
 # templating constants
 INDENT = '  '
-PUML_NAMESPACE_START_TPL = '{indentation}namespace {namespace_name} {{'
-PUML_NAMESPACE_END_TPL = '{indentation}}}\n'
-
-
-def get_or_create_module_package(root_package: Package, domain_parts: List[str]) -> Package:
-    '''Returns or create the package containing the tail domain part'''
-    package = root_package
-    for domain_part in domain_parts:
-        domain_package = next((
-            sub_package for sub_package in package.children
-            if sub_package.name == domain_part
-        ), None)
-        if domain_package is None:
-            domain_package = Package(domain_part)
-            package.children.append(domain_package)
-        package = domain_package
-    return package
+PUML_NAMESPACE_END = '}\n'
+
 
-def visit_package(package: Package, parent_namespace_names: Tuple[str], indentation_level: int) -> Iterable[str]:
+@dataclass
+class PackageVisit:
     '''
-    Recursively visits the package and its subpackages to produce the PlantUML documentation about the namespace
+    State of the visit of a package: how its namespace is documented and which of its sub-packages remain to be visited
     '''
+    print_namespace: bool
+    indentation: Optional[str]
+    start_of_namespace_line: Optional[str]
+    sub_packages_parent_names: Tuple[str, ...]
+    sub_packages_indentation_level: int
+    remaining_sub_packages: Iterator[Package]
+    has_inner_namespace: bool = False
+
+def start_package_visit(package: Package, parent_namespace_names: Tuple[str, ...], indentation_level: int) -> PackageVisit:
     package_with_items = package.items_number > 0
     # prints the namespace if:
     # - it has inner uml_items
@@ -44,41 +40,90 @@ def visit_package(package: Package, parent_namespace_names: Tuple[str], indentat
         namespace_names += (package.name,)
 
     # starts the namespace declaration (without an end-of-line line return, we don't know yet whether there is inner content)
+    indentation = None
     start_of_namespace_line = None
     if print_namespace:
         # initializes the namespace decalaration but not yield yet: we don't know if it should be closed now or if there is inner content
-        start_of_namespace_line = PUML_NAMESPACE_START_TPL.format(
-            indentation=INDENT * indentation_level,
-            namespace_name='.'.join(namespace_names)
-        )
-
-    parent_names = () if print_namespace else namespace_names
-    has_inner_namespace = False
-    for sub_package in package.children:
-        for sub_package_line in visit_package(sub_package, parent_names, next_indentation):
-            if not has_inner_namespace:
-                has_inner_namespace = True
-                # ends the start-of-namespace with a line return because some inner namespace is about to be documented
-                if print_namespace:
-                    yield f'{start_of_namespace_line}\n'
-            yield sub_package_line
-
-    # yields the end-of-namespace brace:
-    # - with an indentation if it had sub-packages
-    # - right after the opening brace otherwise
-    if print_namespace:
-        if has_inner_namespace:
-            yield PUML_NAMESPACE_END_TPL.format(indentation=INDENT * indentation_level)
-        else:
-            yield PUML_NAMESPACE_END_TPL.format(indentation=start_of_namespace_line)
+        indentation = INDENT * indentation_level
+        start_of_namespace_line = f"{indentation}namespace {'.'.join(namespace_names)} {{"
+
+    return PackageVisit(
+        print_namespace,
+        indentation,
+        start_of_namespace_line,
+        () if print_namespace else namespace_names,
+        next_indentation,
+        iter(package.children)
+    )
+
+def visit_package(package: Package, parent_namespace_names: Tuple[str, ...], indentation_level: int) -> Iterable[str]:
+    '''
+    Visits the package and its subpackages to produce the PlantUML documentation about the namespace.
+    The packages are visited depth-first with an explicit stack of the ongoing package visits, instead of recursive calls
+    '''
+    package_visits: List[PackageVisit] = [start_package_visit(package, parent_namespace_names, indentation_level)]
+    # number of the ongoing package visits (at the bottom of the stack) which already have inner namespace content
+    visits_with_inner_namespace_number = 0
+    while package_visits:
+        package_visit = package_visits[-1]
+        sub_package = next(package_visit.remaining_sub_packages, None)
+        if sub_package is not None:
+            package_visits.append(start_package_visit(
+                sub_package, package_visit.sub_packages_parent_names, package_visit.sub_packages_indentation_level
+            ))
+            continue
+
+        # all the sub-packages have been visited
+        package_visits.pop()
+        visits_with_inner_namespace_number = min(visits_with_inner_namespace_number, len(package_visits))
+        if package_visit.print_namespace:
+            # ends the start-of-namespace of the parent packages with a line return (outermost first)
+            # because some inner namespace is about to be documented
+            for parent_package_visit in package_visits[visits_with_inner_namespace_number:]:
+                parent_package_visit.has_inner_namespace = True
+                if parent_package_visit.print_namespace:
+                    yield f'{parent_package_visit.start_of_namespace_line}\n'
+            visits_with_inner_namespace_number = len(package_visits)
+
+            # yields the end-of-namespace brace:
+            # - with an indentation if it had sub-packages
+            # - right after the opening brace otherwise
+            if package_visit.has_inner_namespace:
+                yield f'{package_visit.indentation}{PUML_NAMESPACE_END}'
+            else:
+                yield f'{package_visit.start_of_namespace_line}{PUML_NAMESPACE_END}'
+
+def get_or_create_package_by_fqn(packages_by_fqn: Dict[str, Package], package_fqn: str) -> Package:
+    '''
+    Returns or create the package of the given fully-qualified name, with the packages already created by their fully-qualified names:
+    a new package is attached to its parent package, itself looked up (or created) by its name instead of walking down from the root package
+    '''
+    # goes up the fully-qualified names until an existing package is found
+    missing_package_fqns: List[str] = []
+    package = packages_by_fqn.get(package_fqn)
+    while package is None:
+        missing_package_fqns.append(package_fqn)
+        package_fqn = package_fqn.rpartition('.')[0]
+        package = packages_by_fqn.get(package_fqn)
+
+    # creates the missing packages from the outermost one
+    for missing_package_fqn in reversed(missing_package_fqns):
+        sub_package = Package(missing_package_fqn.rpartition('.')[2])
+        package.children.append(sub_package)
+        packages_by_fqn[missing_package_fqn] = sub_package
+        package = sub_package
+
+    return package
 
 def build_packages_structure(uml_items: List[UmlItem]) -> Package:
     '''
     Creates the Package arborescent structure with the given UML items with their fully-qualified module names
     '''
     root_package = Package(None)
+    # the root package has an empty fully-qualified name
+    packages_by_fqn: Dict[str, Package] = {'': root_package}
     for uml_item in uml_items:
-        module_package = get_or_create_module_package(root_package, uml_item.fqn.split('.')[:-1])
+        module_package = get_or_create_package_by_fqn(packages_by_fqn, uml_item.fqn.rpartition('.')[0])
         module_package.items_number += 1
 
     return root_package
@@ -87,12 +132,8 @@ def puml_namespace_content(uml_items: List[UmlItem]) -> Iterable[str]:
     '''
     Yields the documentation about the packages structure in the PlantUML syntax
     '''
-    root_package = Package(None)
     # creates the Package arborescent structure with the given UML items with their fully-qualified module names
-    for uml_item in uml_items:
-        class_package = get_or_create_module_package(root_package, uml_item.fqn.split('.')[:-1])
-        class_package.items_number += 1
+    root_package = build_packages_structure(uml_items)
 
     # yields the documentation using a visitor pattern approach
-    for namespace_line in visit_package(root_package, (), 0):
-        yield f"{namespace_line}"
+    yield from visit_package(root_package, (), 0)
@@ -3,22 +3,20 @@ from typing import List, Iterable
 from py2puml.domain.umlitem import UmlItem
 from py2puml.domain.umlclass import UmlClass
 from py2puml.domain.umlenum import UmlEnum
-from py2puml.domain.umlrelation import UmlRelation
+from py2puml.domain.umlrelation import UmlRelation, RelType
 from py2puml.export.namespace import puml_namespace_content
 
-PUML_FILE_START = '@startuml {diagram_name}\n'
 PUML_FILE_FOOTER = 'footer Generated by //py2puml//\n'
 PUML_FILE_END = '@enduml\n'
-PUML_ITEM_START_TPL = '{item_type} {item_fqn} {{\n'
-PUML_ATTR_TPL = '  {attr_name}: {attr_type}{staticity}\n'
 PUML_ITEM_END = '}\n'
-PUML_RELATION_TPL = '{source_fqn} {rel_type}-- {target_fqn}\n'
+# the arrow of each relation type is built once instead of reading the enum value and formatting it for each relation
+PUML_RELATION_ARROWS = {rel_type: f' {rel_type.value}-- ' for rel_type in RelType}
 
 FEATURE_STATIC = ' {static}'
 FEATURE_INSTANCE = ''
 
 def to_puml_content(diagram_name: str, uml_items: List[UmlItem], uml_relations: List[UmlRelation]) -> Iterable[str]:
-    yield PUML_FILE_START.format(diagram_name=diagram_name)
+    yield f'@startuml {diagram_name}\n'
 
     # exports the namespaces
     for namespace_line in puml_namespace_content(uml_items):
@@ -26,28 +24,27 @@ def to_puml_content(diagram_name: str, uml_items: List[UmlItem], uml_relations:
 
     # exports the domain classes and enums
     for uml_item in uml_items:
+        # f-strings are compiled into string-building bytecode, whereas str.format parses the template at each call
         if isinstance(uml_item, UmlEnum):
             uml_enum: UmlEnum = uml_item
-            yield PUML_ITEM_START_TPL.format(item_type='enum', item_fqn=uml_enum.fqn)
+            yield f'enum {uml_enum.fqn} {{\n'
             for member in uml_enum.members:
-                yield PUML_ATTR_TPL.format(attr_name=member.name, attr_type=member.value, staticity=FEATURE_STATIC)
+                yield f'  {member.name}: {member.value}{FEATURE_STATIC}\n'
             yield PUML_ITEM_END
         elif isinstance(uml_item, UmlClass):
             uml_class: UmlClass = uml_item
-            yield PUML_ITEM_START_TPL.format(item_type='abstract class' if uml_item.is_abstract else 'class', item_fqn=uml_class.fqn)
+            item_type = 'abstract class' if uml_class.is_abstract else 'class'
+            yield f'{item_type} {uml_class.fqn} {{\n'
             for uml_attr in uml_class.attributes:
-                yield PUML_ATTR_TPL.format(attr_name=uml_attr.name, attr_type=uml_attr.type, staticity=FEATURE_STATIC if uml_attr.static else FEATURE_INSTANCE)
+                staticity = FEATURE_STATIC if uml_attr.static else FEATURE_INSTANCE
+                yield f'  {uml_attr.name}: {uml_attr.type}{staticity}\n'
             yield PUML_ITEM_END
         else:
             raise TypeError(f'cannot process uml_item of type {uml_item.__class__}')
 
     # exports the domain relationships between classes and enums
     for uml_relation in uml_relations:
-        yield PUML_RELATION_TPL.format(
-            source_fqn=uml_relation.source_fqn,
-            rel_type=uml_relation.type.value,
-            target_fqn=uml_relation.target_fqn
-        )
+        yield f'{uml_relation.source_fqn}{PUML_RELATION_ARROWS[uml_relation.type]}{uml_relation.target_fqn}\n'
 
     yield PUML_FILE_FOOTER
     yield PUML_FILE_END
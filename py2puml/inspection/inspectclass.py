@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from importlib import import_module
 from inspect import isabstract
 from re import compile as re_compile
 from typing import Type, List, Dict
@@ -10,7 +9,7 @@ from py2puml.domain.umlclass import UmlClass, UmlAttribute
 from py2puml.domain.umlrelation import UmlRelation, RelType
 from py2puml.parsing.astvisitors import shorten_compound_type_annotation
 from py2puml.parsing.parseclassconstructor import parse_class_constructor
-from py2puml.parsing.moduleresolver import ModuleResolver
+from py2puml.parsing.moduleresolver import ModuleResolver, get_module_resolver
 # from py2puml.utils import investigate_domain_definition
 
 
@@ -34,7 +33,8 @@ def inspect_static_attributes(
     class_type_fqn: str,
     root_module_name: str,
     domain_items_by_fqn: Dict[str, UmlItem],
-    domain_relations: List[UmlRelation]
+    domain_relations: List[UmlRelation],
+    module_resolvers_by_name: Dict[str, ModuleResolver]
 ) -> List[UmlAttribute]:
     '''
     Adds the definitions:
@@ -55,14 +55,14 @@ def inspect_static_attributes(
     type_annotations = getattr(class_type, '__annotations__', None)
     if type_annotations is not None:
         # stores only once the compositions towards the same class
-        relations_by_target_fqdn: Dict[str: UmlRelation] = {}
+        relations_by_target_fqdn: Dict[str, UmlRelation] = {}
         # utility which outputs the fully-qualified name of the attribute types
-        module_resolver = ModuleResolver(import_module(class_type.__module__))
+        module_resolver = get_module_resolver(module_resolvers_by_name, class_type.__module__)
 
         # builds the definitions of the class attrbutes and their relationships by iterating over the type annotations 
         for attr_name, attr_class in type_annotations.items():
             attr_raw_type = str(attr_class)
-            concrete_type_match = CONCRETE_TYPE_PATTERN.search(attr_raw_type)
+            concrete_type_match = CONCRETE_TYPE_PATTERN.match(attr_raw_type)
             # basic type
             if concrete_type_match:
                 concrete_type = concrete_type_match.group(1)
@@ -94,13 +94,16 @@ def inspect_class_type(
     class_type_fqn: str,
     root_module_name: str,
     domain_items_by_fqn: Dict[str, UmlItem],
-    domain_relations: List[UmlRelation]
+    domain_relations: List[UmlRelation],
+    module_resolvers_by_name: Dict[str, ModuleResolver]
 ):
     attributes = inspect_static_attributes(
         class_type, class_type_fqn, root_module_name,
-        domain_items_by_fqn, domain_relations
+        domain_items_by_fqn, domain_relations, module_resolvers_by_name
+    )
+    instance_attributes, compositions = parse_class_constructor(
+        class_type, class_type_fqn, root_module_name, module_resolvers_by_name
     )
-    instance_attributes, compositions = parse_class_constructor(class_type, class_type_fqn, root_module_name)
     attributes.extend(instance_attributes)
     domain_relations.extend(compositions.values())
 
@@ -111,14 +114,16 @@ def inspect_dataclass_type(
     class_type_fqn: str,
     root_module_name: str,
     domain_items_by_fqn: Dict[str, UmlItem],
-    domain_relations: List[UmlRelation]
+    domain_relations: List[UmlRelation],
+    module_resolvers_by_name: Dict[str, ModuleResolver]
 ):
     for attribute in inspect_static_attributes(
         class_type,
         class_type_fqn,
         root_module_name,
         domain_items_by_fqn,
-        domain_relations
+        domain_relations,
+        module_resolvers_by_name
     ):
         attribute.static = False
 
@@ -4,33 +4,33 @@ from types import ModuleType
 
 from dataclasses import is_dataclass
 from enum import Enum
-from inspect import getmembers, isclass
+from inspect import isclass
 
 from py2puml.domain.umlitem import UmlItem
 from py2puml.domain.umlrelation import UmlRelation
 from py2puml.inspection.inspectclass import inspect_dataclass_type, inspect_class_type
 from py2puml.inspection.inspectenum import inspect_enum_type
 from py2puml.inspection.inspectnamedtuple import inspect_namedtuple_type
+from py2puml.parsing.moduleresolver import ModuleResolver
 
 
 def filter_domain_definitions(module: ModuleType, root_module_name: str) -> Iterable[Type]:
     for definition_key in dir(module):
         definition_type = getattr(module, definition_key)
         if isclass(definition_type):
-            definition_members = getmembers(definition_type)
-            definition_module_member = next((
-                member for member in definition_members
-                # ensures that the type belongs to the module being parsed
-                if member[0] == '__module__' and member[1].startswith(root_module_name)
-            ), None)
-            if definition_module_member is not None:
+            # ensures that the type belongs to the module being parsed
+            # (reads __module__ from the class namespace instead of listing and sorting all the class members with inspect.getmembers;
+            # like getmembers, it skips the types of C extensions, whose __module__ is not in their namespace)
+            definition_module_name: str = vars(definition_type).get('__module__')
+            if definition_module_name is not None and definition_module_name.startswith(root_module_name):
                 yield definition_type
 
 def inspect_domain_definition(
     definition_type: Type,
     root_module_name: str,
     domain_items_by_fqn: Dict[str, UmlItem],
-    domain_relations: List[UmlRelation]
+    domain_relations: List[UmlRelation],
+    module_resolvers_by_name: Dict[str, ModuleResolver]
 ):
     definition_type_fqn = f'{definition_type.__module__}.{definition_type.__name__}'
     if definition_type_fqn not in domain_items_by_fqn:
@@ -41,20 +41,23 @@ def inspect_domain_definition(
         elif is_dataclass(definition_type):
             inspect_dataclass_type(
                 definition_type, definition_type_fqn,
-                root_module_name, domain_items_by_fqn, domain_relations
+                root_module_name, domain_items_by_fqn, domain_relations, module_resolvers_by_name
             )
         else:
             inspect_class_type(
                 definition_type, definition_type_fqn,
-                root_module_name, domain_items_by_fqn, domain_relations
+                root_module_name, domain_items_by_fqn, domain_relations, module_resolvers_by_name
             )
 
 def inspect_module(
     domain_item_module: ModuleType,
     root_module_name: str,
     domain_items_by_fqn: Dict[str, UmlItem],
-    domain_relations: List[UmlRelation]
+    domain_relations: List[UmlRelation],
+    module_resolvers_by_name: Dict[str, ModuleResolver]
 ):
     # processes only the definitions declared or imported within the given root module
     for definition_type in filter_domain_definitions(domain_item_module, root_module_name):
-        inspect_domain_definition(definition_type, root_module_name, domain_items_by_fqn, domain_relations)
+        inspect_domain_definition(
+            definition_type, root_module_name, domain_items_by_fqn, domain_relations, module_resolvers_by_name
+        )
@@ -1,4 +1,3 @@
-from importlib import import_module
 from pkgutil import walk_packages
 from types import ModuleType
 from typing import Dict, List
@@ -6,6 +5,7 @@ from typing import Dict, List
 from py2puml.domain.umlitem import UmlItem
 from py2puml.domain.umlrelation import UmlRelation
 from py2puml.inspection.inspectmodule import inspect_module
+from py2puml.parsing.moduleresolver import ModuleResolver, get_imported_module
 
 
 def inspect_package(
@@ -14,12 +14,15 @@ def inspect_package(
     domain_items_by_fqn: Dict[str, UmlItem],
     domain_relations: List[UmlRelation]
 ):
+    # the module resolvers are shared by the modules of the package, for this inspection only
+    module_resolvers_by_name: Dict[str, ModuleResolver] = {}
     for _, name, is_pkg in walk_packages([domain_path], f'{domain_module}.'):
         if not is_pkg:
-            domain_item_module: ModuleType = import_module(name)
+            domain_item_module: ModuleType = get_imported_module(name)
             inspect_module(
                 domain_item_module,
                 domain_module,
                 domain_items_by_fqn,
-                domain_relations
+                domain_relations,
+                module_resolvers_by_name
             )
@@ -1,12 +1,12 @@
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
+import ast
 from ast import (
-    NodeVisitor, arg, expr,
+    AST, NodeVisitor, arg, expr,
     FunctionDef, Assign, AnnAssign,
     Attribute, Name, Subscript, get_source_segment
 )
-from collections import namedtuple
 
 from py2puml.domain.umlclass import UmlAttribute
 from py2puml.domain.umlrelation import UmlRelation, RelType
@@ -14,14 +14,87 @@ from py2puml.parsing.compoundtypesplitter import CompoundTypeSplitter, SPLITTING
 from py2puml.parsing.moduleresolver import ModuleResolver, NamespacedType
 
 
-Variable = namedtuple('Variable', ['id', 'type_expr'])
+class Variable(NamedTuple):
+    '''
+    A variable found in a constructor:
+    - its identifier
+    - the expression of its type annotation, if any
+    '''
+    id: str
+    type_expr: Optional[expr]
+
 
-class SignatureVariablesCollector(NodeVisitor):
+VISIT_METHOD_PREFIX = 'visit_'
+
+class DispatchingNodeVisitor(NodeVisitor):
+    '''
+    Node visitor which dispatches the nodes to their visit_* methods with a lookup in a {node type: method} table,
+    instead of building the 'visit_' + node.__class__.__name__ method name and getattr-ing it for every visited node.
+    The table is built once per visitor class, when the class is defined.
+    '''
+    # {node type: visit method} table, built for each subclass
+    _visit_methods = {}
+    # types of the nodes whose subtrees cannot contain any node of interest for the visitor
+    skipped_node_types = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._visit_methods = {
+            getattr(ast, method_name[len(VISIT_METHOD_PREFIX):]): getattr(cls, method_name)
+            for method_name in dir(cls)
+            if method_name.startswith(VISIT_METHOD_PREFIX) and (
+                # skips the visit_* methods inherited from NodeVisitor
+                getattr(cls, method_name) is not getattr(NodeVisitor, method_name, None)
+            ) and (
+                hasattr(ast, method_name[len(VISIT_METHOD_PREFIX):])
+            )
+        }
+
+    def visit(self, node: AST):
+        visit_method = self._visit_methods.get(node.__class__)
+        if visit_method is None:
+            return self.generic_visit(node)
+        return visit_method(self, node)
+
+    def generic_visit(self, node: AST):
+        '''
+        Visits the descendants of the node in depth-first order with an explicit stack instead of recursive calls:
+        the nodes handled by a visit_* method are passed to it, the other ones are expanded in the stack
+        (unless they are of a skipped node type)
+        '''
+        visit_methods = self._visit_methods
+        skipped_node_types = self.skipped_node_types
+        nodes_stack: List[AST] = child_nodes(node)[::-1]
+        while nodes_stack:
+            child_node = nodes_stack.pop()
+            visit_method = visit_methods.get(child_node.__class__)
+            if visit_method is None:
+                if not isinstance(child_node, skipped_node_types):
+                    nodes_stack.extend(reversed(child_nodes(child_node)))
+            else:
+                visit_method(self, child_node)
+
+def child_nodes(node: AST) -> List[AST]:
+    '''
+    Lists the direct child nodes of the given node, by iterating over its fields directly
+    (instead of using the ast.iter_child_nodes generator)
+    '''
+    nodes: List[AST] = []
+    for field_name in node._fields:
+        field_value = getattr(node, field_name, None)
+        if isinstance(field_value, list):
+            for child_node in field_value:
+                if isinstance(child_node, AST):
+                    nodes.append(child_node)
+        elif isinstance(field_value, AST):
+            nodes.append(field_value)
+    return nodes
+
+class SignatureVariablesCollector(DispatchingNodeVisitor):
     '''
     Collects the variables and their type annotations from the signature of a constructor method
     '''
-    def __init__(self, constructor_source: str, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init__(self, constructor_source: str):
         self.constructor_source = constructor_source
         self.class_self_id: str = None
         self.variables: List[Variable] = []
@@ -37,7 +110,7 @@ class SignatureVariablesCollector(NodeVisitor):
             self.variables.append(variable)
 
 
-class AssignedVariablesCollector(NodeVisitor):
+class AssignedVariablesCollector(DispatchingNodeVisitor):
     '''Parses the target of an assignment statement to detect whether the value is assigned to a variable or an instance attribute'''
     def __init__(self, class_self_id: str, annotation: expr):
         self.class_self_id: str = class_self_id
@@ -45,6 +118,14 @@ class AssignedVariablesCollector(NodeVisitor):
         self.variables: List[Variable] = []
         self.self_attributes: List[Variable] = []
 
+    def reset(self, annotation: expr):
+        '''
+        Prepares the collector to parse the target of another assignment in the same constructor
+        '''
+        self.annotation = annotation
+        self.variables = []
+        self.self_attributes = []
+
     def visit_Name(self, node: Name):
         '''
         Detects declarations of new variables
@@ -66,18 +147,22 @@ class AssignedVariablesCollector(NodeVisitor):
         pass
 
 
-class ConstructorVisitor(NodeVisitor):
+class ConstructorVisitor(DispatchingNodeVisitor):
     '''
     Identifies the attributes (and infer their type) assigned to self in the body of a constructor method
     '''
-    def __init__(self, constructor_source: str, class_name: str, root_fqn: str, module_resolver: ModuleResolver, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    # the assignment statements cannot be nested in expressions: their subtrees (decorators, conditions, calls, etc.) are not walked
+    skipped_node_types = (expr,)
+
+    def __init__(self, constructor_source: str, class_name: str, root_fqn: str, module_resolver: ModuleResolver):
         self.constructor_source = constructor_source
         self.class_fqn: str = f'{module_resolver.module.__name__}.{class_name}'
         self.root_fqn = root_fqn
         self.module_resolver = module_resolver
         self.class_self_id: str
-        self.variables_namespace: List[Variable] = []
+        self.assigned_variables_collector: AssignedVariablesCollector
+        # variables in the constructor scope, by id: a variable assigned again shadows the former one
+        self.variables_namespace: Dict[str, Variable] = {}
         self.uml_attributes: List[UmlAttribute] = []
         self.uml_relations_by_target_fqn: Dict[str, UmlRelation] = {}
 
@@ -90,30 +175,32 @@ class ConstructorVisitor(NodeVisitor):
             )
         })
 
-    def get_from_namespace(self, variable_id: str) -> Variable:
-        return next((
-            variable
-            # variables namespace is iterated antichronologically
-            # to account for variables being overridden
-            for variable in self.variables_namespace[::-1]
-            if variable.id == variable_id
-        ), None)
+    def get_from_namespace(self, variable_id: str) -> Optional[Variable]:
+        return self.variables_namespace.get(variable_id)
 
-    def generic_visit(self, node):
-        NodeVisitor.generic_visit(self, node)
+    def extend_namespace(self, variables: List[Variable]):
+        # variables are added chronologically, to account for variables being overridden
+        for variable in variables:
+            self.variables_namespace[variable.id] = variable
 
     def visit_FunctionDef(self, node: FunctionDef):
         # retrieves constructor arguments ('self' reference and typed arguments)
         if node.name == '__init__':
+            # only the signature is collected: the body is walked once, by this visitor
             variables_collector = SignatureVariablesCollector(self.constructor_source)
-            variables_collector.visit(node)
+            variables_collector.visit(node.args)
             self.class_self_id: str = variables_collector.class_self_id
-            self.variables_namespace = variables_collector.variables
+            self.extend_namespace(variables_collector.variables)
+            # a single collector parses the targets of all the assignments of the constructor
+            self.assigned_variables_collector = AssignedVariablesCollector(self.class_self_id, None)
 
-        self.generic_visit(node)
+        # attribute assignments can only be found in the statements of the function body
+        for statement in node.body:
+            self.visit(statement)
 
     def visit_AnnAssign(self, node: AnnAssign):
-        variables_collector = AssignedVariablesCollector(self.class_self_id, node.annotation)
+        variables_collector = self.assigned_variables_collector
+        variables_collector.reset(node.annotation)
         variables_collector.visit(node.target)
 
         short_type, full_namespaced_definitions = self.derive_type_annotation_details(node.annotation)
@@ -123,20 +210,19 @@ class ConstructorVisitor(NodeVisitor):
             self.extend_relations(full_namespaced_definitions)
 
         # if any, there is at most one typed variable added to the scope
-        self.variables_namespace.extend(variables_collector.variables)
+        self.extend_namespace(variables_collector.variables)
 
     def visit_Assign(self, node: Assign):
         # recipients of the assignment
+        variables_collector = self.assigned_variables_collector
+        # the assigned value is the same for all the targets
+        is_value_a_variable = isinstance(node.value, Name)
         for assigned_target in node.targets:
-            variables_collector = AssignedVariablesCollector(self.class_self_id, None)
+            variables_collector.reset(None)
             variables_collector.visit(assigned_target)
 
             # attempts to infer attribute type when a single attribute is assigned to a variable
-            if (
-                len(variables_collector.self_attributes) == 1
-            ) and (
-                isinstance(node.value, Name)
-            ):
+            if is_value_a_variable and len(variables_collector.self_attributes) == 1:
                 assigned_variable = self.get_from_namespace(node.value.id)
                 if assigned_variable is not None:
                     short_type, full_namespaced_definitions = self.derive_type_annotation_details(
@@ -156,7 +242,7 @@ class ConstructorVisitor(NodeVisitor):
                     self.extend_relations(full_namespaced_definitions)
 
             # other assignments were done in new variables that can shadow existing ones
-            self.variables_namespace.extend(variables_collector.variables)
+            self.extend_namespace(variables_collector.variables)
 
 
     def derive_type_annotation_details(self, annotation: expr) -> Tuple[str, List[str]]:
@@ -197,7 +283,17 @@ def shorten_compound_type_annotation(type_annotation: str, module_resolver: Modu
       (note: a space is inserted after each coma for readability sake)
     - a list of the fully-qualified types involved in the annotation: ['typing.Dict', 'datetime.datetime', 'typing.List', 'mymodule.Worker']
     '''
-    compound_type_parts: List[str] = CompoundTypeSplitter(type_annotation, module_resolver.module.__name__).get_parts()
+    shortened_compound_type = module_resolver.shortened_compound_types_by_annotation.get(type_annotation)
+    if shortened_compound_type is None:
+        shortened_compound_type = _shorten_compound_type_annotation(type_annotation, module_resolver)
+        module_resolver.shortened_compound_types_by_annotation[type_annotation] = shortened_compound_type
+
+    # copies the associated types so that the memoized ones cannot be altered by the caller
+    short_type_annotation, associated_types = shortened_compound_type
+    return short_type_annotation, list(associated_types)
+
+def _shorten_compound_type_annotation(type_annotation: str, module_resolver: ModuleResolver) -> Tuple[str, List[str]]:
+    compound_type_parts: Tuple[str, ...] = CompoundTypeSplitter(type_annotation, module_resolver.module.__name__).get_parts()
     compound_short_type_parts: List[str] = []
     associated_types: List[str] = []
     for compound_type_part in compound_type_parts:
@@ -6,6 +6,7 @@ from typing import Tuple
 FORWARD_REFERENCES: Pattern = re_compile(r"ForwardRef\('([^']+)'\)")
 IS_COMPOUND_TYPE: Pattern = re_compile(r'^[a-z|A-Z|0-9|\[|\]|\.|,|\s|_]+$')
 SPLITTING_CHARACTERS = ('[', ']', ',')
+SPLITTING_PATTERN: Pattern = re_compile(r'([\[\],])')
 
 
 def remove_forward_references(compound_type_annotation: str, module_name: str) -> str:
@@ -14,7 +15,11 @@ def remove_forward_references(compound_type_annotation: str, module_name: str) -
     This happens when a class attribute refers to the class being defined (where Person.friends is of type List[Person])
     The type which is referred to is prefixed by the module where it is defined to help resolution.
     '''
-    return None if compound_type_annotation is None else FORWARD_REFERENCES.sub(f'{module_name}.\\1', compound_type_annotation)
+    # most annotations have no forward reference: the substitution (and its replacement template) is skipped for them
+    if compound_type_annotation is None or 'ForwardRef(' not in compound_type_annotation:
+        return compound_type_annotation
+
+    return FORWARD_REFERENCES.sub(f'{module_name}.\\1', compound_type_annotation)
 
 class CompoundTypeSplitter:
     '''
@@ -29,20 +34,10 @@ class CompoundTypeSplitter:
 
         self.compound_type_annotation = resolved_type_annotations
     
-    def get_parts(self) -> Tuple[str]:
-        parts = [self.compound_type_annotation]
-        for splitting_character in SPLITTING_CHARACTERS:
-            new_parts = []
-            for part in parts:
-                splitted_parts = part.split(splitting_character)
-                new_parts.append(splitted_parts[0])
-                if len(splitted_parts) > 1:
-                    for splitted_part in splitted_parts[1:]:
-                        new_parts.extend([splitting_character, splitted_part])
-            parts = [
-                new_part.strip()
-                for new_part in new_parts
-                if len(new_part.strip()) > 0
-            ]
-
-        return tuple(parts)
+    def get_parts(self) -> Tuple[str, ...]:
+        # splits the annotation on all the splitting characters at once, keeping them as parts
+        return tuple(
+            stripped_part
+            for stripped_part in (part.strip() for part in SPLITTING_PATTERN.split(self.compound_type_annotation))
+            if len(stripped_part) > 0
+        )
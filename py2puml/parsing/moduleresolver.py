@@ -1,6 +1,8 @@
+from importlib import import_module
+from sys import modules
 from inspect import isclass
 from functools import reduce
-from typing import Type, Iterable, List, NamedTuple
+from typing import Dict, Type, List, NamedTuple, Tuple
 from types import ModuleType
 
 
@@ -30,7 +32,7 @@ def search_in_module_or_builtins(searched_module: ModuleType, namespace: str):
         return searched_module.__builtins__.get(namespace, None)
 
 
-def search_in_module(namespaces: List[str], module: ModuleType):
+def search_in_module(namespaces: List[str], module: ModuleType) -> NamespacedType:
     leaf_type: Type = reduce(
         search_in_module_or_builtins,
         namespaces,
@@ -62,6 +64,12 @@ class ModuleResolver:
 
     def __init__(self, module: ModuleType):
         self.module = module
+        # memoizes the resolutions: the same types are annotated in many places of a module
+        self.namespaced_types_by_partial_path: Dict[str, NamespacedType] = {}
+        # memoizes the shortened compound type annotations, see astvisitors.shorten_compound_type_annotation
+        self.shortened_compound_types_by_annotation: Dict[str, Tuple[str, List[str]]] = {}
+        # index of the module variables by their full namespace, built at the first resolution
+        self.namespaced_types_by_full_namespace: Dict[str, NamespacedType] = None
 
     def __repr__(self) -> str:
         return f'ModuleResolver({self.module})'
@@ -75,19 +83,16 @@ class ModuleResolver:
         if partial_dotted_path is None:
             return EMPTY_NAMESPACED_TYPE
 
-        def string_repr(module_attribute) -> str:
-            return f'{module_attribute.__module__}.{module_attribute.__name__}' if isclass(module_attribute) else f'{module_attribute}'
+        found_namespaced_type = self.namespaced_types_by_partial_path.get(partial_dotted_path)
+        if found_namespaced_type is None:
+            found_namespaced_type = self._resolve_full_namespace_type(partial_dotted_path)
+            self.namespaced_types_by_partial_path[partial_dotted_path] = found_namespaced_type
+
+        return found_namespaced_type
 
+    def _resolve_full_namespace_type(self, partial_dotted_path: str) -> NamespacedType:
         # searches the class in the module imports
-        namespaced_types_iter: Iterable[NamespacedType] = (
-            NamespacedType(string_repr(getattr(self.module, module_var)), module_var)
-            for module_var in vars(self.module)
-        )
-        found_namespaced_type = next((
-            namespaced_type
-            for namespaced_type in namespaced_types_iter
-            if namespaced_type.full_namespace == partial_dotted_path
-        ), None)
+        found_namespaced_type = self.get_namespaced_types_by_full_namespace().get(partial_dotted_path)
 
         # searches the class in the builtins
         if found_namespaced_type is None:
@@ -95,5 +100,45 @@ class ModuleResolver:
 
         return found_namespaced_type
 
+    def get_namespaced_types_by_full_namespace(self) -> Dict[str, NamespacedType]:
+        '''
+        Indexes the module definitions and imports by their full namespace, once for all the resolutions.
+        When several variables share the same full namespace, the first one in the module wins
+        '''
+        if self.namespaced_types_by_full_namespace is None:
+            def string_repr(module_attribute) -> str:
+                return f'{module_attribute.__module__}.{module_attribute.__name__}' if isclass(module_attribute) else f'{module_attribute}'
+
+            namespaced_types_by_full_namespace: Dict[str, NamespacedType] = {}
+            for module_var in vars(self.module):
+                namespaced_type = NamespacedType(string_repr(getattr(self.module, module_var)), module_var)
+                namespaced_types_by_full_namespace.setdefault(namespaced_type.full_namespace, namespaced_type)
+            self.namespaced_types_by_full_namespace = namespaced_types_by_full_namespace
+
+        return self.namespaced_types_by_full_namespace
+
     def get_module_full_name(self) -> str:
         return self.module.__name__
+
+
+def get_imported_module(module_name: str) -> ModuleType:
+    '''
+    Returns the module of the given name, which is imported only if it was not imported yet:
+    most modules are already loaded (by their package or by the modules importing them), and looking them up
+    in sys.modules spares the import machinery
+    '''
+    module = modules.get(module_name)
+    return import_module(module_name) if module is None else module
+
+def get_module_resolver(module_resolvers_by_name: Dict[str, ModuleResolver], module_name: str) -> ModuleResolver:
+    '''
+    Returns the resolver of the given module, which is created at the first call for this module
+    and memoized in the given dictionary, so that its resolutions are shared by the classes of the module.
+    The dictionary is scoped to one documentation run: the inspected modules may be reloaded between runs
+    '''
+    module_resolver = module_resolvers_by_name.get(module_name)
+    if module_resolver is None:
+        module_resolver = ModuleResolver(get_imported_module(module_name))
+        module_resolvers_by_name[module_name] = module_resolver
+
+    return module_resolver
@@ -2,19 +2,19 @@
 from typing import Dict, List, Tuple, Type
 
 from ast import parse, AST
-from importlib import import_module
 from inspect import getsource, unwrap
 from textwrap import dedent
 
 from py2puml.domain.umlclass import UmlAttribute
 from py2puml.domain.umlrelation import UmlRelation
 from py2puml.parsing.astvisitors import ConstructorVisitor
-from py2puml.parsing.moduleresolver import ModuleResolver
+from py2puml.parsing.moduleresolver import ModuleResolver, get_module_resolver
 
 def parse_class_constructor(
     class_type: Type,
     class_fqn: str,
-    root_module_name: str
+    root_module_name: str,
+    module_resolvers_by_name: Dict[str, ModuleResolver]
 ) -> Tuple[List[UmlAttribute], Dict[str, UmlRelation]]:
     constructor = getattr(class_type, '__init__', None)
     # conditions to meet in order to parse the AST of a constructor 
@@ -36,7 +36,7 @@ def parse_class_constructor(
     constructor_source: str = dedent(getsource(constructor.__code__))
     constructor_ast: AST = parse(constructor_source)
 
-    module_resolver = ModuleResolver(import_module(class_type.__module__))
+    module_resolver = get_module_resolver(module_resolvers_by_name, class_type.__module__)
 
     visitor = ConstructorVisitor(constructor_source, class_type.__name__, root_module_name, module_resolver)
     visitor.visit(constructor_ast)
@@ -0,0 +1,4 @@
+from pathlib import Path
+
+# the modules of this sub-package are also looked up in the 'extension' folder (plugin-directory pattern)
+__path__.append(str(Path(__file__).parent.parent / 'extension'))
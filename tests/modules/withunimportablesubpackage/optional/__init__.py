@@ -0,0 +1,2 @@
+# this sub-package depends on a library which is not installed: it cannot be imported and must be skipped
+import not_installed_dependency
@@ -0,0 +1,5 @@
+from dataclasses import dataclass
+
+@dataclass
+class Feature:
+    name: str
@@ -8,6 +8,7 @@ from pytest import fixture
 
 from py2puml.domain.umlitem import UmlItem
 from py2puml.domain.umlrelation import UmlRelation
+from py2puml.parsing.moduleresolver import ModuleResolver
 
 @fixture(scope='function')
 def domain_items_by_fqn() -> Dict[str, UmlItem]:
@@ -16,3 +17,7 @@ def domain_items_by_fqn() -> Dict[str, UmlItem]:
 @fixture(scope='function')
 def domain_relations() -> List[UmlRelation]:
     return []
+
+@fixture(scope='function')
+def module_resolvers_by_name() -> Dict[str, ModuleResolver]:
+    return {}
@@ -1,3 +1,4 @@
+from sys import getrecursionlimit
 from typing import Dict, List, Tuple
 
 from pytest import mark
@@ -5,7 +6,7 @@ from pytest import mark
 from py2puml.domain.package import Package
 from py2puml.domain.umlitem import UmlItem
 from py2puml.domain.umlrelation import UmlRelation
-from py2puml.export.namespace import build_packages_structure, get_or_create_module_package, visit_package
+from py2puml.export.namespace import build_packages_structure, get_or_create_package_by_fqn, visit_package
 from py2puml.inspection.inspectpackage import inspect_package
 
 
@@ -14,10 +15,16 @@ from py2puml.inspection.inspectpackage import inspect_package
     (Package(None, [Package('py2puml')]), 'py2puml'),
     (Package(None), 'py2puml.export.namespace'),
 ])
-def test_get_or_create_module_package(root_package: Package, module_qualified_name: str):
+def test_get_or_create_package_by_fqn(root_package: Package, module_qualified_name: str):
+    packages_by_fqn: Dict[str, Package] = {'': root_package}
+    for child_package in root_package.children:
+        packages_by_fqn[child_package.name] = child_package
+
     module_parts = module_qualified_name.split('.')
-    module_package = get_or_create_module_package(root_package, module_parts)
+    module_package = get_or_create_package_by_fqn(packages_by_fqn, module_qualified_name)
     assert module_package.name == module_parts[-1], 'the module package has the expected name'
+    assert packages_by_fqn[module_qualified_name] is module_package, 'the module package is registered by its fully-qualified name'
+    assert get_or_create_package_by_fqn(packages_by_fqn, module_qualified_name) is module_package, 'the module package is created once'
 
     # checks that the hierarchy of intermediary nested packages has been created if necessary
     inner_package = root_package
@@ -110,6 +117,17 @@ def test_visit_package(
         assert expected_namespace_line == namespace_line
 
 
+def test_visit_package_deeper_than_the_recursion_limit():
+    packages_depth = getrecursionlimit() + 1
+    deep_package = Package('leaf', NO_CHILDREN_PACKAGES, 1)
+    for _ in range(packages_depth - 1):
+        deep_package = Package('nested', [deep_package])
+
+    assert list(visit_package(deep_package, tuple(), 0)) == [
+        f"namespace {'nested.' * (packages_depth - 1)}leaf {{}}\n"
+    ]
+
+
 def test_build_packages_structure_visit_package_from_tree_package(
     domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation]
 ):
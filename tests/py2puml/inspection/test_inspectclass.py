@@ -5,18 +5,20 @@ from py2puml.domain.umlitem import UmlItem
 from py2puml.domain.umlclass import UmlClass, UmlAttribute
 from py2puml.domain.umlrelation import UmlRelation, RelType
 from py2puml.inspection.inspectmodule import inspect_module
+from py2puml.parsing.moduleresolver import ModuleResolver
 
 from tests.asserts.attribute import assert_attribute
 from tests.asserts.relation import assert_relation
 
 
 def test_inspect_module_should_find_static_and_instance_attributes(
-    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation]
+    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation],
+    module_resolvers_by_name: Dict[str, ModuleResolver]
 ):
     inspect_module(
         import_module('tests.modules.withconstructor'),
         'tests.modules.withconstructor',
-        domain_items_by_fqn, domain_relations
+        domain_items_by_fqn, domain_relations, module_resolvers_by_name
     )
 
     assert len(domain_items_by_fqn) == 2, 'two classes must be inspected'
@@ -67,12 +69,13 @@ def test_inspect_module_should_find_static_and_instance_attributes(
     )
 
 def test_inspect_module_should_find_abstract_class(
-    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation]
+    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation],
+    module_resolvers_by_name: Dict[str, ModuleResolver]
 ):
     inspect_module(
         import_module('tests.modules.withabstract'),
         'tests.modules.withabstract',
-        domain_items_by_fqn, domain_relations
+        domain_items_by_fqn, domain_relations, module_resolvers_by_name
     )
 
     assert len(domain_items_by_fqn) == 2, 'two classes must be inspected'
@@ -88,18 +91,19 @@ def test_inspect_module_should_find_abstract_class(
     assert domain_relations[0].target_fqn == 'tests.modules.withabstract.ConcreteClass'
 
 def test_inspect_module_parse_class_constructor_should_not_process_inherited_constructor(
-    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation]
+    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation],
+    module_resolvers_by_name: Dict[str, ModuleResolver]
 ):
     # inspects the two sub-modules
     inspect_module(
         import_module('tests.modules.withinheritedconstructor.point'),
         'tests.modules.withinheritedconstructor.point',
-        domain_items_by_fqn, domain_relations
+        domain_items_by_fqn, domain_relations, module_resolvers_by_name
     )
     inspect_module(
         import_module('tests.modules.withinheritedconstructor.metricorigin'),
         'tests.modules.withinheritedconstructor.metricorigin',
-        domain_items_by_fqn, domain_relations
+        domain_items_by_fqn, domain_relations, module_resolvers_by_name
     )
 
     assert len(domain_items_by_fqn) == 3, 'three classes must be inspected'
@@ -124,12 +128,13 @@ def test_inspect_module_parse_class_constructor_should_not_process_inherited_con
     assert_attribute(unit_attribute, 'unit', 'str', expected_staticity=True)
 
 def test_inspect_module_should_unwrap_decorated_constructor(
-    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation]
+    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation],
+    module_resolvers_by_name: Dict[str, ModuleResolver]
 ):
     inspect_module(
         import_module('tests.modules.withwrappedconstructor'),
         'tests.modules.withwrappedconstructor',
-        domain_items_by_fqn, domain_relations
+        domain_items_by_fqn, domain_relations, module_resolvers_by_name
     )
 
     assert len(domain_items_by_fqn) == 2, 'two classes must be inspected'
@@ -146,12 +151,13 @@ def test_inspect_module_should_unwrap_decorated_constructor(
     assert len(point_without_wrapping_umlitem.attributes) == 0, 'the attributes of the original constructor could not be found, the constructor was not wrapped by the decorator'
 
 def test_inspect_module_should_handle_compound_types_with_numbers_in_their_name(
-    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation]
+    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation],
+    module_resolvers_by_name: Dict[str, ModuleResolver]
 ):
     fqdn = 'tests.modules.withcompoundtypewithdigits'
     inspect_module(
         import_module(fqdn), fqdn,
-        domain_items_by_fqn, domain_relations
+        domain_items_by_fqn, domain_relations, module_resolvers_by_name
     )
 
     assert len(domain_items_by_fqn) == 2, 'two classes must be inspected'
@@ -16,7 +16,7 @@ from tests.modules.withinheritancewithinmodule import GlowingFish
 def test_inspect_domain_definition_single_class_without_composition():
     domain_items_by_fqn: Dict[str, UmlItem] = {}
     domain_relations: List[UmlRelation] = []
-    inspect_domain_definition(Contact, 'tests.modules.withbasictypes', domain_items_by_fqn, domain_relations)
+    inspect_domain_definition(Contact, 'tests.modules.withbasictypes', domain_items_by_fqn, domain_relations, {})
 
     umlitems_by_fqn = list(domain_items_by_fqn.items())
     assert len(umlitems_by_fqn) == 1, 'one class must be inspected'
@@ -39,7 +39,7 @@ def test_inspect_domain_definition_single_class_without_composition():
 def test_inspect_domain_definition_single_class_with_composition():
     domain_items_by_fqn: Dict[str, UmlItem] = {}
     domain_relations: List[UmlRelation] = []
-    inspect_domain_definition(Worker, 'tests.modules.withcomposition', domain_items_by_fqn, domain_relations)
+    inspect_domain_definition(Worker, 'tests.modules.withcomposition', domain_items_by_fqn, domain_relations, {})
 
     assert len(domain_items_by_fqn) == 1, 'one class must be inspected'
     assert len(domain_relations) == 2, 'class has 2 domain components'
@@ -62,7 +62,7 @@ def test_inspect_domain_definition_single_class_with_composition():
 def test_parse_inheritance_within_module():
     domain_items_by_fqn: Dict[str, UmlItem] = {}
     domain_relations: List[UmlRelation] = []
-    inspect_domain_definition(GlowingFish, 'tests.modules.withinheritancewithinmodule', domain_items_by_fqn, domain_relations)
+    inspect_domain_definition(GlowingFish, 'tests.modules.withinheritancewithinmodule', domain_items_by_fqn, domain_relations, {})
 
     umlitems_by_fqn = list(domain_items_by_fqn.values())
     assert len(umlitems_by_fqn) == 1, 'the class with multiple inheritance was inspected'
@@ -11,7 +11,7 @@ from tests.asserts.attribute import assert_attribute
 def test_parse_namedtupled_class():
     domain_items_by_fqn: Dict[str, UmlItem] = {}
     domain_relations: List[UmlRelation] = []
-    inspect_domain_definition(Circle, 'tests.modules.withnamedtuple', domain_items_by_fqn, domain_relations)
+    inspect_domain_definition(Circle, 'tests.modules.withnamedtuple', domain_items_by_fqn, domain_relations, {})
 
     umlitems_by_fqn = list(domain_items_by_fqn.items())
     assert len(umlitems_by_fqn) == 1, 'one namedtuple must be inspected'
@@ -0,0 +1,31 @@
+from typing import Dict, List
+
+from py2puml.domain.umlitem import UmlItem
+from py2puml.domain.umlrelation import UmlRelation
+from py2puml.inspection.inspectpackage import inspect_package
+
+
+def test_inspect_package_skips_unimportable_subpackages(
+    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation]
+):
+    # the 'optional' sub-package imports a library which is not installed
+    inspect_package(
+        'tests/modules/withunimportablesubpackage', 'tests.modules.withunimportablesubpackage',
+        domain_items_by_fqn, domain_relations
+    )
+
+    assert list(domain_items_by_fqn.keys()) == ['tests.modules.withunimportablesubpackage.domain.Vehicle']
+
+def test_inspect_package_walks_the_extended_path_of_subpackages(
+    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation]
+):
+    # the 'plugins' sub-package adds the 'extension' folder to its __path__
+    inspect_package(
+        'tests/modules/withextendedpath', 'tests.modules.withextendedpath',
+        domain_items_by_fqn, domain_relations
+    )
+
+    assert list(domain_items_by_fqn.keys()) == [
+        'tests.modules.withextendedpath.plugins.core.Core',
+        'tests.modules.withextendedpath.plugins.plugin.Plugin',
+    ]
@@ -1,13 +1,13 @@
 
 from typing import Dict, Tuple, List
 
-from ast import parse, AST, get_source_segment
+from ast import parse, AST, get_source_segment, AnnAssign, Assign, Attribute, FunctionDef, Name, Subscript, arg
 from inspect import getsource
 from textwrap import dedent
 
 from pytest import mark
 
-from py2puml.parsing.astvisitors import AssignedVariablesCollector, SignatureVariablesCollector, Variable, shorten_compound_type_annotation
+from py2puml.parsing.astvisitors import AssignedVariablesCollector, ConstructorVisitor, SignatureVariablesCollector, Variable, shorten_compound_type_annotation
 from py2puml.parsing.moduleresolver import ModuleResolver
 
 from tests.asserts.variable import assert_Variable
@@ -27,6 +27,16 @@ class ParseMyConstructorArguments:
     ):
         pass
 
+@mark.parametrize(['visitor_class', 'visited_node_types'], [
+    (SignatureVariablesCollector, {arg}),
+    (AssignedVariablesCollector, {Name, Attribute, Subscript}),
+    (ConstructorVisitor, {FunctionDef, AnnAssign, Assign}),
+])
+def test_visit_methods_table_is_built_per_visitor_class(visitor_class: type, visited_node_types: set):
+    assert set(visitor_class._visit_methods.keys()) == visited_node_types
+    for node_type, visit_method in visitor_class._visit_methods.items():
+        assert visit_method is getattr(visitor_class, f'visit_{node_type.__name__}')
+
 def test_SignatureVariablesCollector_collect_arguments():
     constructor_source: str = dedent(getsource(ParseMyConstructorArguments.__init__.__code__))
     constructor_ast: AST = parse(constructor_source)
@@ -53,6 +63,8 @@ def test_SignatureVariablesCollector_collect_arguments():
         ('self', 'self.my_attr: int = 6', 'int', [('my_attr', 'int')], []),
         # tuple assignment mixing variable and attribute
         ('self', 'my_var, self.my_attr = 5, 6', None, [('my_attr', None)], [('my_var', None)]),
+        # nested tuple assignment: variables are collected in the depth-first order of the targets
+        ('self', 'a, (self.b, c), d = 1, (2, 3), 4', None, [('b', None)], [('a', None), ('c', None), ('d', None)]),
         # assignment to a subscript of an attribute
         ('self', 'self.my_attr[0] = 0', None, [], []),
         ('self', 'self.my_attr[0]:int = 0', 'int', [], []),
@@ -143,6 +155,20 @@ def test_AssignedVariablesCollector_multiple_assignments_separate_variable_from_
             assert variable.id == variable_id
             assert variable.type_expr == None, 'Python does not allow type annotation in multiple assignment'
 
+def test_AssignedVariablesCollector_reset_between_assignments():
+    annotated_assignment: AST = parse('self.x: int = 0').body[0]
+    assignment: AST = parse('y, self.z = 1, 2').body[0]
+
+    assignment_collector = AssignedVariablesCollector('self', annotated_assignment.annotation)
+    assignment_collector.visit(annotated_assignment.target)
+    assert [attribute.id for attribute in assignment_collector.self_attributes] == ['x']
+
+    assignment_collector.reset(None)
+    assignment_collector.visit(assignment.targets[0])
+    assert assignment_collector.annotation is None
+    assert [(variable.id, variable.type_expr) for variable in assignment_collector.variables] == [('y', None)]
+    assert [(attribute.id, attribute.type_expr) for attribute in assignment_collector.self_attributes] == [('z', None)]
+
 @mark.parametrize(['full_annotation', 'short_annotation', 'namespaced_definitions', 'module_dict'], [
     (
         # domain.people was imported, people.Person is used
@@ -188,3 +214,25 @@ def test_shorten_compound_type_annotation(full_annotation: str, short_annotation
     shortened_annotation, full_namespaced_definitions = shorten_compound_type_annotation(full_annotation, module_resolver)
     assert shortened_annotation == short_annotation
     assert full_namespaced_definitions == namespaced_definitions
+
+def test_shorten_compound_type_annotation_memoizes_shortenings():
+    module_resolver = ModuleResolver(MockedInstance({
+        '__name__': 'testmodule',
+        'List': List,
+        'domain': {
+            'Person': {
+                '__module__': 'domain',
+                '__name__': 'Person',
+            }
+        }
+    }))
+    shortened_annotation, full_namespaced_definitions = shorten_compound_type_annotation('List[domain.Person]', module_resolver)
+    assert module_resolver.shortened_compound_types_by_annotation == {
+        'List[domain.Person]': ('List[Person]', ['typing.List', 'domain.Person'])
+    }
+
+    # the memoized definitions are not altered by the callers
+    full_namespaced_definitions.clear()
+    assert shorten_compound_type_annotation('List[domain.Person]', module_resolver) == (
+        shortened_annotation, ['typing.List', 'domain.Person']
+    )
@@ -1,4 +1,8 @@
-from py2puml.parsing.moduleresolver import ModuleResolver, NamespacedType
+from importlib import import_module
+
+from py2puml.parsing.moduleresolver import (
+    ModuleResolver, NamespacedType, get_imported_module, get_module_resolver
+)
 
 from tests.py2puml.parsing.mockedinstance import MockedInstance
 
@@ -40,9 +44,47 @@ def test_ModuleResolver_resolve_full_namespace_type():
         'Coordinates'
     ), 'tests.modules.withconstructor.Coordinates', 'Coordinates')
 
+def test_ModuleResolver_indexes_module_variables_by_full_namespace():
+    module_resolver = ModuleResolver(import_module('tests.modules.withconstructor'))
+    namespaced_types_by_full_namespace = module_resolver.get_namespaced_types_by_full_namespace()
+    assert_NamespacedType(
+        namespaced_types_by_full_namespace['tests.modules.withenum.TimeUnit'], 'tests.modules.withenum.TimeUnit', 'TimeUnit'
+    )
+    assert_NamespacedType(
+        namespaced_types_by_full_namespace['tests.modules.withconstructor.Point'], 'tests.modules.withconstructor.Point', 'Point'
+    )
+    # the index is built once
+    assert module_resolver.get_namespaced_types_by_full_namespace() is namespaced_types_by_full_namespace
+
 def test_ModuleResolver_get_module_full_name():
     source_module = MockedInstance({
         '__name__': 'tests.modules.withconstructor'
     })
     module_resolver = ModuleResolver(source_module)
     assert module_resolver.get_module_full_name() == 'tests.modules.withconstructor'
+
+def test_ModuleResolver_memoizes_resolutions():
+    source_module = MockedInstance({
+        '__name__': 'tests.modules.withconstructor',
+        'Coordinates': {
+            '__module__': 'tests.modules.withconstructor',
+            '__name__': 'Coordinates'
+        }
+    })
+    module_resolver = ModuleResolver(source_module)
+    namespaced_type = module_resolver.resolve_full_namespace_type('Coordinates')
+    assert module_resolver.resolve_full_namespace_type('Coordinates') is namespaced_type
+
+def test_get_module_resolver_memoizes_resolvers_by_module_name():
+    module_resolvers_by_name = {}
+    module_resolver = get_module_resolver(module_resolvers_by_name, 'tests.modules.withconstructor')
+    assert module_resolver.get_module_full_name() == 'tests.modules.withconstructor'
+    assert get_module_resolver(module_resolvers_by_name, 'tests.modules.withconstructor') is module_resolver
+
+    # the resolvers are not shared between inspections
+    assert get_module_resolver({}, 'tests.modules.withconstructor') is not module_resolver
+
+def test_get_imported_module_returns_the_imported_module():
+    assert get_imported_module('tests.modules.withconstructor') is import_module('tests.modules.withconstructor')
+    # already imported modules are returned as well
+    assert get_imported_module('tests.modules.withconstructor') is import_module('tests.modules.withconstructor')
@@ -2,6 +2,7 @@ from io import StringIO
 from pathlib import Path
 
 from py2puml.asserts import assert_py2puml_is_file_content, assert_py2puml_is_stringio
+from py2puml.py2puml import py2puml
 
 
 CURRENT_DIR = Path(__file__).parent
@@ -40,3 +41,12 @@ footer Generated by //py2puml//
 """
 
     assert_py2puml_is_stringio('tests/modules/withsubdomain/', 'tests.modules.withsubdomain', StringIO(expected))
+
+def test_py2puml_documents_the_whole_py2puml_package():
+    '''
+    Ensures that the annotations of the py2puml classes can be resolved by py2puml itself
+    '''
+    puml_content = ''.join(py2puml('py2puml', 'py2puml'))
+
+    assert puml_content.startswith('@startuml py2puml\n')
+    assert 'class py2puml.parsing.astvisitors.ConstructorVisitor {' in puml_content